@@ -2,8 +2,29 @@ from __future__ import annotations
 
 import os
 
+import pytest
+
 os.environ.setdefault("EXTERNAL_CLIENT_RETRY_ATTEMPTS", "1")
 os.environ.setdefault("EXTERNAL_CLIENT_RETRY_INITIAL_MS", "0")
 os.environ.setdefault("EXTERNAL_CLIENT_RETRY_MAX_MS", "0")
 os.environ.setdefault("EXTERNAL_CLIENT_RETRY_JITTER", "0")
 
+
+class MnemonicPool:
+    """Session-wide BIP39 mnemonics, generated on first access by index."""
+
+    def __init__(self) -> None:
+        self._mnemonics: list[str] = []
+
+    def __getitem__(self, index: int) -> str:
+        import bittensor as bt
+
+        while len(self._mnemonics) <= index:
+            self._mnemonics.append(bt.Keypair.generate_mnemonic())
+        return self._mnemonics[index]
+
+
+@pytest.fixture(scope="session")
+def mnemonic_pool() -> MnemonicPool:
+    # Distinct indices yield distinct mnemonics; tests needing a mismatch take two indices.
+    return MnemonicPool()
@@ -2,14 +2,14 @@ from __future__ import annotations
 
 import pytest
 
-from caster_commons.config.llm import LlmSettings
-from caster_commons.tools.desearch import DeSearchAiDateFilter, DeSearchClient
-from caster_commons.tools.desearch_ai_protocol import DeSearchAiDocsResponse
-
 pytestmark = [pytest.mark.anyio("asyncio"), pytest.mark.integration]
 
 
 async def test_desearch_ai_search_live() -> None:
+    from caster_commons.config.llm import LlmSettings
+    from caster_commons.tools.desearch import DeSearchAiDateFilter, DeSearchClient
+    from caster_commons.tools.desearch_ai_protocol import DeSearchAiDocsResponse
+
     settings = LlmSettings()
     assert settings.desearch_api_key_value, "DESEARCH_API_KEY must be set"
 
@@ -8,6 +8,7 @@ import threading
 from typing import TYPE_CHECKING
 
 from caster_validator.application.accept_batch import AcceptEvaluationBatch
+from caster_validator.application.dto.evaluation import MinerTaskBatchSpec
 from caster_validator.application.services.evaluation_batch import EvaluationBatchConfig, MinerTaskBatchService
 from caster_validator.application.status import StatusProvider
 from caster_validator.infrastructure.state.batch_inbox import InMemoryBatchInbox
@@ -95,31 +96,41 @@ class EvaluationWorker:
         task = self._task
         return bool(task is not None and not task.done())
 
+    async def drain_once(self) -> bool:
+        """Process the next queued batch inline; return False when the inbox is empty."""
+        batch = self._inbox.next()
+        if batch is None:
+            return False
+        await self._process(batch)
+        return True
+
     async def _run(self) -> None:
         while not self._stop.is_set():
             batch = await asyncio.to_thread(self._inbox.get, stop_event=self._stop)
             if batch is None:
                 continue
+            await self._process(batch)
+
+    async def _process(self, batch: MinerTaskBatchSpec) -> None:
+        if self._batch_tracker is not None:
+            self._batch_tracker.mark_processing(batch.batch_id)
+        if self._status is not None:
+            self._status.state.queued_batches = len(self._inbox)
 
+        try:
+            await self._batch_service.process_async(batch)
+            if self._batch_tracker is not None:
+                self._batch_tracker.mark_completed(batch.batch_id)
+        except Exception as exc:
             if self._batch_tracker is not None:
-                self._batch_tracker.mark_processing(batch.batch_id)
+                self._batch_tracker.mark_retryable_or_completed(batch.batch_id)
+            logger.exception(
+                "batch processing failed",
+                extra={"batch_id": str(batch.batch_id)},
+            )
             if self._status is not None:
-                self._status.state.queued_batches = len(self._inbox)
-
-            try:
-                await self._batch_service.process_async(batch)
-                if self._batch_tracker is not None:
-                    self._batch_tracker.mark_completed(batch.batch_id)
-            except Exception as exc:
-                if self._batch_tracker is not None:
-                    self._batch_tracker.mark_retryable_or_completed(batch.batch_id)
-                logger.exception(
-                    "batch processing failed",
-                    extra={"batch_id": str(batch.batch_id)},
-                )
-                if self._status is not None:
-                    self._status.state.last_error = str(exc)
-                    self._status.state.running = False
+                self._status.state.last_error = str(exc)
+                self._status.state.running = False
 
 
 def create_evaluation_worker(
@@ -1,9 +1,22 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import pytest
 
+if TYPE_CHECKING:
+    import bittensor as bt
+
 
 @pytest.fixture
 def anyio_backend() -> str:
     # Force AnyIO-managed tests in validator suite (unit + integration) to use asyncio only
     return "asyncio"
+
+
+@pytest.fixture(scope="session")
+def keypair() -> bt.Keypair:
+    # Signing identity is irrelevant to the HTTP client tests; a fixed seed skips BIP39 mnemonic stretching.
+    import bittensor as bt
+
+    return bt.Keypair.create_from_seed("0x" + "00" * 32)
@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+_HEADER_PREFIX = 'Bittensor ss58="'
+_HEADER_SEPARATOR = '",sig="'
+
+
+def parse_auth_header(header: str) -> tuple[str, str]:
+    """Split a client-built Bittensor Authorization header into its ss58 address and hex signature."""
+
+    assert header.startswith(_HEADER_PREFIX), f"malformed Authorization header: {header!r}"
+    assert header.endswith('"'), f"malformed Authorization header: {header!r}"
+    ss58, separator, sig = header[len(_HEADER_PREFIX) : -1].partition(_HEADER_SEPARATOR)
+    assert separator, f"malformed Authorization header: {header!r}"
+    return ss58, sig
@@ -71,35 +71,39 @@ def _make_submission(
     )
 
 
-def test_in_memory_store_records_miner_task_run_submissions() -> None:
+@pytest.fixture(scope="module")
+def sample_submission() -> MinerTaskRunSubmission:
+    return _make_submission()
+
+
+def test_in_memory_store_records_miner_task_run_submissions(sample_submission) -> None:
     store = InMemoryEvaluationRecordStore()
-    submission = _make_submission()
 
-    store.record(submission)
+    store.record(sample_submission)
 
     records = store.records()
-    assert records == (submission,)
+    assert records == (sample_submission,)
 
 
-def test_in_memory_store_duplicate_identical_pair_is_a_noop() -> None:
+def test_in_memory_store_duplicate_identical_pair_is_a_noop(sample_submission) -> None:
     store = InMemoryEvaluationRecordStore()
-    submission = _make_submission()
 
-    store.record(submission)
-    store.record(submission)
+    store.record(sample_submission)
+    store.record(sample_submission)
 
-    assert store.records() == (submission,)
+    assert store.records() == (sample_submission,)
 
 
-def test_in_memory_store_rejects_conflicting_duplicate_pair() -> None:
+def test_in_memory_store_rejects_conflicting_duplicate_pair(sample_submission) -> None:
     store = InMemoryEvaluationRecordStore()
-    batch_id = uuid4()
-    artifact_id = uuid4()
-    task_id = uuid4()
-    submission = _make_submission(batch_id=batch_id, artifact_id=artifact_id, task_id=task_id, score=1.0)
-    conflicting = _make_submission(batch_id=batch_id, artifact_id=artifact_id, task_id=task_id, score=0.0)
+    conflicting = _make_submission(
+        batch_id=sample_submission.batch_id,
+        artifact_id=sample_submission.run.artifact_id,
+        task_id=sample_submission.run.task_id,
+        score=0.0,
+    )
 
-    store.record(submission)
+    store.record(sample_submission)
 
     with pytest.raises(
         RuntimeError,
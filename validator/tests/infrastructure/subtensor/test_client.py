@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+from functools import cache
+
+import pytest
+
 from caster_commons.config.subtensor import SubtensorSettings
 from caster_validator.infrastructure.subtensor.client import RuntimeSubtensorClient
 from validator.tests.fixtures.subtensor import FakeSubtensorClient
 
 
+@cache
 def make_settings() -> SubtensorSettings:
     return SubtensorSettings(
         network="local",
@@ -19,19 +24,27 @@ def make_settings() -> SubtensorSettings:
     )
 
 
-def test_runtime_subtensor_client_uses_factory() -> None:
-    fake = FakeSubtensorClient()
-    client = RuntimeSubtensorClient(make_settings(), client_factory=lambda cfg: fake)
+@pytest.fixture
+def settings() -> SubtensorSettings:
+    return make_settings()
+
+
+@pytest.fixture
+def fake() -> FakeSubtensorClient:
+    return FakeSubtensorClient()
+
+
+def test_runtime_subtensor_client_uses_factory(settings, fake) -> None:
+    client = RuntimeSubtensorClient(settings, client_factory=lambda cfg: fake)
 
     client.connect()
 
     assert fake.connected is True
 
 
-def test_runtime_subtensor_client_delegates_calls() -> None:
-    fake = FakeSubtensorClient()
+def test_runtime_subtensor_client_delegates_calls(settings, fake) -> None:
     snapshot = fake.metagraph = fake.metagraph.__class__(uids=(1, 2), hotkeys=("a", "b"))
-    client = RuntimeSubtensorClient(make_settings(), client_factory=lambda cfg: fake)
+    client = RuntimeSubtensorClient(settings, client_factory=lambda cfg: fake)
 
     assert client.fetch_metagraph() == snapshot
 
@@ -1,43 +1,74 @@
 from __future__ import annotations
 
-import bittensor as bt
+import shutil
+import tempfile
+from collections.abc import Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING
+
 import pytest
 
-from caster_validator.infrastructure.subtensor.hotkey import ensure_wallet_hotkey_from_mnemonic
+if TYPE_CHECKING:
+    import bittensor as bt
+
+
+_TMPFS_ROOT = Path("/dev/shm")  # noqa: S108 - tmpfs scratch space for tiny keyfiles
 
 
-def _make_wallet(tmp_path) -> bt.wallet.Wallet:
-    return bt.wallet(name="validator", hotkey="default", path=str(tmp_path))
+@pytest.fixture(scope="module")
+def wallet_root(tmp_path_factory: pytest.TempPathFactory) -> Iterator[Path]:
+    # Keyfiles are a few hundred bytes, so tmpfs is safe here; everything else keeps pytest's default temp root.
+    if not _TMPFS_ROOT.is_dir():
+        yield tmp_path_factory.mktemp("wallets", numbered=True)
+        return
+    root = Path(tempfile.mkdtemp(prefix="caster-wallets-", dir=_TMPFS_ROOT))
+    yield root
+    shutil.rmtree(root, ignore_errors=True)
 
 
-def test_ensure_wallet_hotkey_from_mnemonic_creates_hotkey_when_missing(tmp_path) -> None:
-    mnemonic = bt.Keypair.generate_mnemonic()
-    wallet = _make_wallet(tmp_path)
+@pytest.fixture(scope="module")
+def provisioned_wallet(wallet_root: Path, mnemonic_pool) -> tuple[bt.wallet.Wallet, str, str]:
+    import bittensor as bt
 
+    from caster_validator.infrastructure.subtensor.hotkey import ensure_wallet_hotkey_from_mnemonic
+
+    mnemonic = mnemonic_pool[0]
+    expected_ss58 = bt.Keypair.create_from_mnemonic(mnemonic).ss58_address
+    wallet = _make_wallet(wallet_root, name="provisioned")
     assert wallet.hotkey_file.exists_on_device() is False
 
     ensure_wallet_hotkey_from_mnemonic(wallet, mnemonic)
+    return wallet, mnemonic, expected_ss58
 
-    assert wallet.hotkey_file.exists_on_device() is True
-    assert wallet.hotkey.ss58_address == bt.Keypair.create_from_mnemonic(mnemonic).ss58_address
 
+def _make_wallet(root: Path, *, name: str = "validator") -> bt.wallet.Wallet:
+    import bittensor as bt
 
-def test_ensure_wallet_hotkey_from_mnemonic_is_idempotent_when_matches(tmp_path) -> None:
-    mnemonic = bt.Keypair.generate_mnemonic()
-    wallet = _make_wallet(tmp_path)
+    return bt.wallet(name=name, hotkey="default", path=str(root))
 
-    ensure_wallet_hotkey_from_mnemonic(wallet, mnemonic)
-    expected_ss58 = wallet.hotkey.ss58_address
 
-    ensure_wallet_hotkey_from_mnemonic(wallet, mnemonic)
+@pytest.mark.parametrize("second_call_mnemonic_kind", ("absent", "same"))
+def test_ensure_wallet_hotkey_from_mnemonic_provisions_matching_hotkey(
+    provisioned_wallet,
+    second_call_mnemonic_kind: str,
+) -> None:
+    from caster_validator.infrastructure.subtensor.hotkey import ensure_wallet_hotkey_from_mnemonic
+
+    wallet, mnemonic, expected_ss58 = provisioned_wallet
+
+    if second_call_mnemonic_kind == "same":
+        ensure_wallet_hotkey_from_mnemonic(wallet, mnemonic)
 
+    assert wallet.hotkey_file.exists_on_device() is True
     assert wallet.hotkey.ss58_address == expected_ss58
 
 
-def test_ensure_wallet_hotkey_from_mnemonic_raises_when_mismatched(tmp_path) -> None:
-    mnemonic = bt.Keypair.generate_mnemonic()
-    other_mnemonic = bt.Keypair.generate_mnemonic()
-    wallet = _make_wallet(tmp_path)
+def test_ensure_wallet_hotkey_from_mnemonic_raises_when_mismatched(wallet_root: Path, mnemonic_pool) -> None:
+    from caster_validator.infrastructure.subtensor.hotkey import ensure_wallet_hotkey_from_mnemonic
+
+    mnemonic = mnemonic_pool[0]
+    other_mnemonic = mnemonic_pool[1]
+    wallet = _make_wallet(wallet_root, name="mismatched")
 
     ensure_wallet_hotkey_from_mnemonic(wallet, mnemonic)
 
@@ -46,6 +77,8 @@ def test_ensure_wallet_hotkey_from_mnemonic_raises_when_mismatched(tmp_path) ->
 
 
 def test_create_wallet_raises_when_missing_mnemonic_and_keyfile(tmp_path, monkeypatch) -> None:
+    import bittensor as bt
+
     from caster_commons.config.subtensor import SubtensorSettings
     from caster_validator.infrastructure.subtensor.hotkey import create_wallet
 
@@ -7,33 +7,27 @@ import pytest
 from caster_validator.infrastructure.state.backoff_file import FileBackoff
 
 
-def test_read_missing_returns_none(tmp_path: Path) -> None:
-    target = tmp_path / "backoff.txt"
-    backoff = FileBackoff(target)
-
-    assert backoff.read_last_block() is None
-
-
-def test_write_and_read_last_block(tmp_path: Path) -> None:
-    target = tmp_path / "backoff.txt"
-    backoff = FileBackoff(target)
-
-    backoff.write_last_block(1_234)
-    assert backoff.read_last_block() == 1_234
-
-
-def test_should_skip_respects_min_blocks(tmp_path: Path) -> None:
-    target = tmp_path / "backoff.txt"
-    backoff = FileBackoff(target)
-    backoff.write_last_block(1_000)
-
-    skip, remaining = backoff.should_skip(1_050, 100)
-    assert skip is True
-    assert remaining == 50
-
-    skip, remaining = backoff.should_skip(1_200, 100)
-    assert skip is False
-    assert remaining == 0
+@pytest.mark.parametrize(
+    ("stored_block", "op", "args", "expected"),
+    (
+        (None, "read_last_block", (), None),
+        (1_234, "read_last_block", (), 1_234),
+        (1_000, "should_skip", (1_050, 100), (True, 50)),
+        (1_000, "should_skip", (1_200, 100), (False, 0)),
+    ),
+)
+def test_backoff_behaviour(
+    tmp_path: Path,
+    stored_block: int | None,
+    op: str,
+    args: tuple[int, ...],
+    expected: object,
+) -> None:
+    backoff = FileBackoff(tmp_path / "backoff.txt")
+    if stored_block is not None:
+        backoff.write_last_block(stored_block)
+
+    assert getattr(backoff, op)(*args) == expected
 
 
 def test_invalid_file_contents_raise(tmp_path: Path) -> None:
@@ -9,7 +9,26 @@ import pytest
 from caster_commons.tools.desearch import DeSearchAiDateFilter, DeSearchClient
 from caster_commons.tools.search_models import SearchWebSearchRequest, SearchXSearchRequest
 
-pytestmark = pytest.mark.anyio("asyncio")
+pytestmark = pytest.mark.anyio
+
+_WEB_REQUEST = SearchWebSearchRequest(query="caster subnet", num=5)
+_EXPECTED_WEB_URL = "https://api.desearch.ai/web?query=caster+subnet&num=5"
+_X_REQUEST = SearchXSearchRequest(query="#caster", count=3)
+_EXPECTED_X_URL = "https://api.desearch.ai/twitter?query=%23caster&count=3"
+
+_JSON_HEADERS = {"content-type": "application/json"}
+_EMPTY_DATA_BODY = b'{"data":[]}'
+_ERROR_BODY = b'{"error":"failure"}'
+
+_EXPECTED_AI_SEARCH_PAYLOAD: dict[str, Any] = {
+    "prompt": "caster subnet",
+    "tools": ["twitter"],
+    "date_filter": "PAST_24_HOURS",
+    "result_type": "LINKS_WITH_FINAL_SUMMARY",
+    "system_message": "",
+    "streaming": False,
+    "count": 200,
+}
 
 
 def _capture_request() -> tuple[dict[str, Any], httpx.MockTransport]:
@@ -20,7 +39,7 @@ def _capture_request() -> tuple[dict[str, Any], httpx.MockTransport]:
         captured["url"] = str(request.url)
         captured["headers"] = dict(request.headers)
         captured["params"] = request.url.params
-        return httpx.Response(200, json={"data": []})
+        return httpx.Response(200, content=_EMPTY_DATA_BODY, headers=_JSON_HEADERS)
 
     transport = httpx.MockTransport(handler)
     return captured, transport
@@ -36,18 +55,17 @@ async def test_desearch_client_posts_payload() -> None:
         client=client,
     )
 
-    request = SearchWebSearchRequest(query="caster subnet", num=5)
-    result = await adapter.search_links_web(request)
+    result = await adapter.search_links_web(_WEB_REQUEST)
 
     assert result.data == []
     assert captured["method"] == "GET"
-    assert captured["url"] == "https://api.desearch.ai/web?query=caster+subnet&num=5"
+    assert captured["url"] == _EXPECTED_WEB_URL
     assert captured["headers"]["authorization"] == "test-key"
 
 
 async def test_desearch_client_raises_on_error_status() -> None:
     async def handler(request: httpx.Request) -> httpx.Response:
-        return httpx.Response(500, json={"error": "failure"})
+        return httpx.Response(500, content=_ERROR_BODY, headers=_JSON_HEADERS)
 
     client = httpx.AsyncClient(
         base_url="https://api.desearch.ai",
@@ -56,7 +74,7 @@ async def test_desearch_client_raises_on_error_status() -> None:
     adapter = DeSearchClient(base_url="https://api.desearch.ai", api_key="test-key", client=client)
 
     with pytest.raises(RuntimeError):
-        await adapter.search_links_web(SearchWebSearchRequest(query="caster subnet"))
+        await adapter.search_links_web(_WEB_REQUEST)
 
 
 async def test_desearch_client_twitter_search() -> None:
@@ -74,31 +92,21 @@ async def test_desearch_client_twitter_search() -> None:
     )
     adapter = DeSearchClient(base_url="https://api.desearch.ai", api_key="key", client=client)
 
-    response = await adapter.search_links_twitter(SearchXSearchRequest(query="#caster", count=3))
+    response = await adapter.search_links_twitter(_X_REQUEST)
 
     assert response.data[0].text == "hello"
     assert captured["method"] == "GET"
-    assert captured["url"] == "https://api.desearch.ai/twitter?query=%23caster&count=3"
+    assert captured["url"] == _EXPECTED_X_URL
 
 
 async def test_desearch_client_ai_search_twitter_posts_posts_payload() -> None:
-    async def handler(request: httpx.Request) -> httpx.Response:
-        assert request.headers["authorization"] == "key"
+    captured: dict[str, Any] = {}
 
+    async def handler(request: httpx.Request) -> httpx.Response:
         if request.url.path == "/desearch/ai/search":
-            assert request.method == "POST"
-            payload = json.loads(request.content)
-            assert payload["prompt"] == "caster subnet"
-            assert payload["tools"] == ["twitter"]
-            assert payload["result_type"] == "LINKS_WITH_FINAL_SUMMARY"
-            assert payload["system_message"] == ""
-            assert payload["streaming"] is False
-            assert payload["count"] == 200
-            assert payload["date_filter"] == "PAST_24_HOURS"
-            assert "start_date" not in payload
-            assert "end_date" not in payload
-            assert "model" not in payload
-
+            captured["method"] = request.method
+            captured["authorization"] = request.headers["authorization"]
+            captured["payload"] = json.loads(request.content)
             return httpx.Response(
                 200,
                 json={
@@ -131,6 +139,11 @@ async def test_desearch_client_ai_search_twitter_posts_posts_payload() -> None:
         date_filter=DeSearchAiDateFilter.PAST_24_HOURS,
     )
 
+    assert captured == {
+        "method": "POST",
+        "authorization": "key",
+        "payload": _EXPECTED_AI_SEARCH_PAYLOAD,
+    }
     assert response.tweets and len(response.tweets) == 1
     assert response.tweets[0].id == "123"
     assert response.completion == "hello"
@@ -1,43 +1,56 @@
 from __future__ import annotations
 
-import re
+from collections.abc import Callable
+from typing import TYPE_CHECKING
 from uuid import uuid4
 
-import bittensor as bt
 import httpx
 import pytest
 
-from caster_commons.bittensor import build_canonical_request
-from caster_validator.infrastructure.tools.platform_client import HttpPlatformClient
+from validator.tests.fixtures.auth_header import parse_auth_header
 
-_HEADER_PATTERN = re.compile(
-    r'^Bittensor\s+ss58="(?P<ss58>[^"]+)",\s*sig="(?P<sig>[0-9a-f]+)"$'
-)
+if TYPE_CHECKING:
+    import bittensor as bt
 
+    from caster_validator.infrastructure.tools.platform_client import HttpPlatformClient
 
-def _keypair() -> bt.Keypair:
-    return bt.Keypair.create_from_mnemonic(bt.Keypair.generate_mnemonic())
 
+@pytest.fixture
+def make_platform_client(
+    keypair: bt.Keypair,
+) -> Callable[[Callable[[httpx.Request], httpx.Response]], HttpPlatformClient]:
+    from caster_validator.infrastructure.tools.platform_client import HttpPlatformClient
+
+    def _make(handler: Callable[[httpx.Request], httpx.Response]) -> HttpPlatformClient:
+        return HttpPlatformClient(
+            base_url="https://mock.local",
+            hotkey=keypair,
+            transport=httpx.MockTransport(handler),
+        )
+
+    return _make
+
+
+def _assert_signed(request: httpx.Request, keypair: bt.Keypair, ss58: str) -> None:
+    from caster_commons.bittensor import build_canonical_request
 
-def _assert_signed(request: httpx.Request, keypair: bt.Keypair) -> None:
     header = request.headers.get("Authorization")
     assert header is not None
-    match = _HEADER_PATTERN.match(header)
-    assert match is not None
-    assert match.group("ss58") == keypair.ss58_address
-    path = request.url.raw_path.decode()
-    query = request.url.query
-    if query:
-        path = f"{path}?{query}"
+    header_ss58, sig = parse_auth_header(header)
+    assert header_ss58 == ss58
+    # httpx's raw_path already carries the query string, so a single decode yields the signed path_qs.
+    path_qs = request.url.raw_path.decode()
     body = request.content or b""
-    canonical = build_canonical_request(request.method, path, body)
-    signature = bytes.fromhex(match.group("sig"))
+    canonical = build_canonical_request(request.method, path_qs, body)
+    signature = bytes.fromhex(sig)
     assert keypair.verify(canonical, signature)
 
 
-def test_get_champion_weights_returns_weights() -> None:
+def test_get_champion_weights_returns_weights(keypair, make_platform_client) -> None:
+    ss58 = keypair.ss58_address
+
     def handler(request: httpx.Request) -> httpx.Response:
-        _assert_signed(request, keypair)
+        _assert_signed(request, keypair, ss58)
         if request.method == "GET" and request.url.path == "/v1/weights":
             payload = {
                 "weights": {"42": 0.7, "7": 0.3},
@@ -46,12 +59,7 @@ def test_get_champion_weights_returns_weights() -> None:
             return httpx.Response(status_code=200, json=payload)
         return httpx.Response(status_code=404)
 
-    keypair = _keypair()
-    client = HttpPlatformClient(
-        base_url="https://mock.local",
-        hotkey=keypair,
-        transport=httpx.MockTransport(handler),
-    )
+    client = make_platform_client(handler)
 
     weights = client.get_champion_weights()
 
@@ -59,15 +67,16 @@ def test_get_champion_weights_returns_weights() -> None:
     assert weights.champion_uid == 42
 
 
-def test_get_miner_task_batch_parses_tasks_and_artifacts() -> None:
+def test_get_miner_task_batch_parses_tasks_and_artifacts(keypair, make_platform_client) -> None:
     batch_id = uuid4()
     task_id = uuid4()
     artifact_id = uuid4()
     champion_artifact_id = uuid4()
     budget_usd = 0.123
+    ss58 = keypair.ss58_address
 
     def handler(request: httpx.Request) -> httpx.Response:
-        _assert_signed(request, keypair)
+        _assert_signed(request, keypair, ss58)
         expected_path = f"/v1/miner-task-batches/batch/{batch_id}"
         if request.method == "GET" and request.url.path == expected_path:
             payload = {
@@ -97,18 +106,13 @@ def test_get_miner_task_batch_parses_tasks_and_artifacts() -> None:
             return httpx.Response(status_code=200, json=payload)
         return httpx.Response(status_code=404)
 
-    keypair = _keypair()
-    client = HttpPlatformClient(
-        base_url="https://mock.local",
-        hotkey=keypair,
-        transport=httpx.MockTransport(handler),
-    )
+    client = make_platform_client(handler)
 
     batch = client.get_miner_task_batch(batch_id)
 
     assert batch.batch_id == batch_id
     assert batch.tasks[0].task_id == task_id
-    assert batch.tasks[0].budget_usd == pytest.approx(budget_usd)
+    assert batch.tasks[0].budget_usd == budget_usd
     assert batch.tasks[0].query.text == "smoke"
     assert batch.tasks[0].reference_answer.text == "ok"
     assert batch.artifacts[0].artifact_id == artifact_id
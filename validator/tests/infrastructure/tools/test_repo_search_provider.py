@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import json
-import re
+from collections.abc import Callable, Iterator
 
 import bittensor as bt
 import httpx
@@ -9,16 +9,54 @@ import pytest
 
 from caster_commons.bittensor import build_canonical_request
 from caster_validator.infrastructure.tools.repo_search_provider import HttpRepoSearchToolProvider
-
-pytestmark = pytest.mark.anyio("asyncio")
-
-_HEADER_PATTERN = re.compile(
-    r'^Bittensor\s+ss58="(?P<ss58>[^"]+)",\s*sig="(?P<sig>[0-9a-f]+)"$'
-)
-
-
-def _keypair() -> bt.Keypair:
-    return bt.Keypair.create_from_mnemonic(bt.Keypair.generate_mnemonic())
+from validator.tests.fixtures.auth_header import parse_auth_header
+
+pytestmark = pytest.mark.anyio
+
+_EXPECTED_SEARCH_BODY = json.dumps(
+    {
+        "repo_url": "https://github.com/org/repo",
+        "commit_sha": "a" * 40,
+        "query": "proxy wiring",
+        "limit": 10,
+        "path_glob": "docs/*.md",
+    },
+    separators=(",", ":"),
+    ensure_ascii=True,
+).encode("utf-8")
+_EXPECTED_GET_FILE_BODY = json.dumps(
+    {
+        "repo_url": "https://github.com/org/repo",
+        "commit_sha": "b" * 40,
+        "path": "docs/a.md",
+        "start_line": 5,
+        "end_line": 12,
+    },
+    separators=(",", ":"),
+    ensure_ascii=True,
+).encode("utf-8")
+
+_Handler = Callable[[httpx.Request], httpx.Response]
+
+
+_ROUTER: dict[str, _Handler] = {}
+_SHARED_TRANSPORT = httpx.MockTransport(lambda request: _ROUTER[request.url.path](request))
+
+
+@pytest.fixture(autouse=True)
+def _reset_router() -> Iterator[None]:
+    yield
+    _ROUTER.clear()
+
+
+@pytest.fixture(scope="module")
+def keypair_and_provider(keypair: bt.Keypair) -> tuple[bt.Keypair, HttpRepoSearchToolProvider]:
+    provider = HttpRepoSearchToolProvider(
+        base_url="https://platform.local",
+        hotkey=keypair,
+        transport=_SHARED_TRANSPORT,
+    )
+    return keypair, provider
 
 
 def _assert_signed_post(
@@ -36,39 +74,25 @@ def _assert_signed_post(
 
     header = request.headers.get("Authorization")
     assert header is not None
-    match = _HEADER_PATTERN.match(header)
-    assert match is not None
-    assert match.group("ss58") == keypair.ss58_address
-
-    path = request.url.raw_path.decode()
-    query = request.url.query
-    if query:
-        path = f"{path}?{query}"
-    canonical = build_canonical_request(request.method, path, request.content)
-    signature = bytes.fromhex(match.group("sig"))
+    ss58, sig = parse_auth_header(header)
+    assert ss58 == keypair.ss58_address
+
+    # httpx's raw_path already carries the query string, so a single decode yields the signed path_qs.
+    path_qs = request.url.raw_path.decode()
+    canonical = build_canonical_request(request.method, path_qs, request.content)
+    signature = bytes.fromhex(sig)
     assert keypair.verify(canonical, signature)
 
 
-async def test_search_repo_posts_signed_payload_and_returns_mapping() -> None:
-    keypair = _keypair()
-    expected_body = json.dumps(
-        {
-            "repo_url": "https://github.com/org/repo",
-            "commit_sha": "a" * 40,
-            "query": "proxy wiring",
-            "limit": 10,
-            "path_glob": "docs/*.md",
-        },
-        separators=(",", ":"),
-        ensure_ascii=True,
-    ).encode("utf-8")
+async def test_search_repo_posts_signed_payload_and_returns_mapping(keypair_and_provider) -> None:
+    keypair, provider = keypair_and_provider
 
     def handler(request: httpx.Request) -> httpx.Response:
         _assert_signed_post(
             request,
             keypair=keypair,
             expected_path="/v1/repo-search/search",
-            expected_body=expected_body,
+            expected_body=_EXPECTED_SEARCH_BODY,
         )
         return httpx.Response(
             status_code=200,
@@ -83,11 +107,7 @@ async def test_search_repo_posts_signed_payload_and_returns_mapping() -> None:
             },
         )
 
-    provider = HttpRepoSearchToolProvider(
-        base_url="https://platform.local",
-        hotkey=keypair,
-        transport=httpx.MockTransport(handler),
-    )
+    _ROUTER["/v1/repo-search/search"] = handler
 
     payload = await provider.search_repo(
         repo_url="https://github.com/org/repo",
@@ -108,26 +128,15 @@ async def test_search_repo_posts_signed_payload_and_returns_mapping() -> None:
     }
 
 
-async def test_get_repo_file_posts_signed_payload_and_returns_mapping() -> None:
-    keypair = _keypair()
-    expected_body = json.dumps(
-        {
-            "repo_url": "https://github.com/org/repo",
-            "commit_sha": "b" * 40,
-            "path": "docs/a.md",
-            "start_line": 5,
-            "end_line": 12,
-        },
-        separators=(",", ":"),
-        ensure_ascii=True,
-    ).encode("utf-8")
+async def test_get_repo_file_posts_signed_payload_and_returns_mapping(keypair_and_provider) -> None:
+    keypair, provider = keypair_and_provider
 
     def handler(request: httpx.Request) -> httpx.Response:
         _assert_signed_post(
             request,
             keypair=keypair,
             expected_path="/v1/repo-search/get-file",
-            expected_body=expected_body,
+            expected_body=_EXPECTED_GET_FILE_BODY,
         )
         return httpx.Response(
             status_code=200,
@@ -142,11 +151,7 @@ async def test_get_repo_file_posts_signed_payload_and_returns_mapping() -> None:
             },
         )
 
-    provider = HttpRepoSearchToolProvider(
-        base_url="https://platform.local",
-        hotkey=keypair,
-        transport=httpx.MockTransport(handler),
-    )
+    _ROUTER["/v1/repo-search/get-file"] = handler
 
     payload = await provider.get_repo_file(
         repo_url="https://github.com/org/repo",
@@ -167,17 +172,13 @@ async def test_get_repo_file_posts_signed_payload_and_returns_mapping() -> None:
     }
 
 
-async def test_non_200_raises_runtime_error() -> None:
-    keypair = _keypair()
+async def test_non_200_raises_runtime_error(keypair_and_provider) -> None:
+    _, provider = keypair_and_provider
 
     def handler(request: httpx.Request) -> httpx.Response:
         return httpx.Response(status_code=503)
 
-    provider = HttpRepoSearchToolProvider(
-        base_url="https://platform.local",
-        hotkey=keypair,
-        transport=httpx.MockTransport(handler),
-    )
+    _ROUTER["/v1/repo-search/search"] = handler
 
     with pytest.raises(RuntimeError, match="platform returned 503 for POST /v1/repo-search/search"):
         await provider.search_repo(
@@ -189,17 +190,13 @@ async def test_non_200_raises_runtime_error() -> None:
         )
 
 
-async def test_non_mapping_payload_raises_runtime_error() -> None:
-    keypair = _keypair()
+async def test_non_mapping_payload_raises_runtime_error(keypair_and_provider) -> None:
+    _, provider = keypair_and_provider
 
     def handler(request: httpx.Request) -> httpx.Response:
         return httpx.Response(status_code=200, json=["not", "an", "object"])
 
-    provider = HttpRepoSearchToolProvider(
-        base_url="https://platform.local",
-        hotkey=keypair,
-        transport=httpx.MockTransport(handler),
-    )
+    _ROUTER["/v1/repo-search/get-file"] = handler
 
     with pytest.raises(
         RuntimeError,
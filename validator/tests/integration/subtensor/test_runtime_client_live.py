@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import time
+from collections.abc import Callable
+from typing import TYPE_CHECKING, TypeVar
 
 import pytest
 
@@ -8,8 +10,13 @@ from caster_validator.application.scheduling.gate import chain_epoch_index, comm
 from caster_validator.infrastructure.subtensor.client import RuntimeSubtensorClient
 from caster_validator.runtime.settings import Settings
 
+if TYPE_CHECKING:
+    import bittensor
+
 pytestmark = pytest.mark.subtensor_live
 
+_T = TypeVar("_T")
+
 
 def _load_settings() -> Settings:
     settings = Settings.load()
@@ -17,6 +24,17 @@ def _load_settings() -> Settings:
     return settings
 
 
+def _await_blocks(subtensor: bittensor.Subtensor, probe: Callable[[], _T | None], *, max_blocks: int) -> _T | None:
+    """Re-run ``probe`` as each new block lands until it yields a value or ``max_blocks`` pass."""
+
+    for _ in range(max_blocks):
+        value = probe()
+        if value is not None:
+            return value
+        subtensor.wait_for_block()
+    return probe()
+
+
 def test_runtime_client_live_commitment_and_weights() -> None:
     settings = _load_settings()
 
@@ -35,6 +53,9 @@ def test_runtime_client_live_commitment_and_weights() -> None:
     validator_info = client.validator_info()
     assert validator_info.uid >= 0, "validator hotkey is not registered on the subnet"
 
+    network_or_endpoint = settings.subtensor.endpoint.strip() or settings.subtensor.network
+    subtensor = bittensor.Subtensor(network=network_or_endpoint)
+
     # Publish and confirm commitment using the canonical marker format.
     now_block = client.current_block()
     tempo = client.tempo(settings.subtensor.netuid)
@@ -42,12 +63,7 @@ def test_runtime_client_live_commitment_and_weights() -> None:
     commitment_payload = commitment_marker(validator_info.uid, epoch)
     client.publish_commitment(commitment_payload, blocks_until_reveal=1)
 
-    fetched = None
-    for _ in range(10):
-        time.sleep(10)
-        fetched = client.fetch_commitment(validator_info.uid)
-        if fetched is not None:
-            break
+    fetched = _await_blocks(subtensor, lambda: client.fetch_commitment(validator_info.uid), max_blocks=10)
     assert fetched is not None, "commitment not retrievable"
 
     baseline_update = client.last_update_block(validator_info.uid)
@@ -63,15 +79,13 @@ def test_runtime_client_live_commitment_and_weights() -> None:
         pytest.fail("no miner UID available on this subnet to set weight for")
 
     # Submit weight and verify via adapter.
-    network_or_endpoint = settings.subtensor.endpoint.strip() or settings.subtensor.network
-    subtensor = bittensor.Subtensor(network=network_or_endpoint)
     weights_rate_limit = int(subtensor.weights_rate_limit(settings.subtensor.netuid))
 
     submit_deadline = time.time() + 300
     while time.time() < submit_deadline:
         current_block = client.current_block()
         if current_block < baseline_value + weights_rate_limit:
-            time.sleep(5)
+            subtensor.wait_for_block()
             continue
         try:
             client.submit_weights({target_uid: 1.0})
@@ -80,24 +94,20 @@ def test_runtime_client_live_commitment_and_weights() -> None:
             message = str(exc).lower()
             if "too soon" not in message:
                 raise
-            time.sleep(10)
+            subtensor.wait_for_block()
     else:
         pytest.skip(
             "unable to submit weights within deadline "
             f"(weights_rate_limit={weights_rate_limit}, last_update={baseline_value})"
         )
 
-    deadline = time.time() + 300
-    observed = baseline_value
-    while time.time() < deadline:
-        time.sleep(5)
+    def _advanced_update() -> int | None:
         latest = client.last_update_block(validator_info.uid)
-        if latest is not None:
-            observed = int(latest)
-        if observed > baseline_value:
-            break
+        return int(latest) if latest is not None and int(latest) > baseline_value else None
+
+    observed = _await_blocks(subtensor, _advanced_update, max_blocks=25)
 
-    assert observed > baseline_value
+    assert observed is not None, f"last_update did not advance past {baseline_value}"
 
     # TODO:
     # - Track reveal_round from submissions and use it to gate polling.
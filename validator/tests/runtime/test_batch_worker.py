@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import asyncio
-import threading
 from collections.abc import Iterable
 from uuid import UUID, uuid4
 
@@ -31,6 +30,10 @@ def _sample_batch() -> MinerTaskBatchSpec:
     )
 
 
+# Frozen model and every test builds its own inbox/tracker, so one instance is safely shared.
+_SAMPLE_BATCH = _sample_batch()
+
+
 def _all_pairs(batch: MinerTaskBatchSpec) -> frozenset[tuple[UUID, UUID]]:
     return frozenset((artifact.artifact_id, task.task_id) for artifact in batch.artifacts for task in batch.tasks)
 
@@ -61,7 +64,7 @@ class FakeBatchService:
 
     def __init__(self, *, on_process=None, error: Exception | None = None) -> None:
         self.processed: list[MinerTaskBatchSpec] = []
-        self.processed_event = threading.Event()
+        self.processed_event = asyncio.Event()
         self._on_process = on_process
         self._error = error
 
@@ -91,11 +94,10 @@ async def test_evaluation_worker_drains_inbox():
         status_provider=status,
         batch_tracker=accept_batch,
     )
-    batch = _sample_batch()
-    accept_batch.execute(batch)
+    accept_batch.execute(_SAMPLE_BATCH)
 
     worker.start()
-    assert await asyncio.to_thread(fake_service.processed_event.wait, timeout=1.0)
+    await asyncio.wait_for(fake_service.processed_event.wait(), 1.0)
     await worker.stop(timeout=1.0)
 
     assert fake_service.processed
@@ -108,7 +110,7 @@ async def test_evaluation_worker_marks_batch_retryable_when_pairs_remain() -> No
     status = StatusProvider()
     progress = ProgressSpy()
     accept_batch = AcceptEvaluationBatch(inbox=inbox, status=status, progress=progress)
-    batch = _sample_batch()
+    batch = _SAMPLE_BATCH
     accept_batch.execute(batch)
     fake_service = FakeBatchService(error=RuntimeError("worker boom"))
 
@@ -119,9 +121,7 @@ async def test_evaluation_worker_marks_batch_retryable_when_pairs_remain() -> No
         batch_tracker=accept_batch,
     )
 
-    worker.start()
-    assert await asyncio.to_thread(fake_service.processed_event.wait, timeout=1.0)
-    await worker.stop(timeout=1.0)
+    assert await worker.drain_once()
 
     accept_batch.execute(batch)
 
@@ -135,7 +135,7 @@ async def test_evaluation_worker_marks_batch_completed_when_all_pairs_are_record
     status = StatusProvider()
     progress = ProgressSpy()
     accept_batch = AcceptEvaluationBatch(inbox=inbox, status=status, progress=progress)
-    batch = _sample_batch()
+    batch = _SAMPLE_BATCH
     accept_batch.execute(batch)
     fake_service = FakeBatchService(
         on_process=lambda current_batch: progress.set_recorded_pairs(current_batch, _all_pairs(current_batch)),
@@ -149,11 +149,10 @@ async def test_evaluation_worker_marks_batch_completed_when_all_pairs_are_record
         batch_tracker=accept_batch,
     )
 
-    worker.start()
-    assert await asyncio.to_thread(fake_service.processed_event.wait, timeout=1.0)
-    await worker.stop(timeout=1.0)
+    assert await worker.drain_once()
 
     accept_batch.execute(batch)
 
     assert len(inbox) == 0
     assert status.state.last_error == "worker boom"
+    assert not await worker.drain_once()
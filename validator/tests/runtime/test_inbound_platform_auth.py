@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import bittensor as bt
 import pytest
 
 import caster_validator.infrastructure.auth.sr25519 as sr25519
@@ -9,8 +8,17 @@ from caster_validator.infrastructure.auth.sr25519 import BittensorSr25519Inbound
 from caster_validator.runtime import bootstrap
 from caster_validator.runtime.settings import Settings
 
+_BODY_SIZES = (0, 1024, 64 * 1024)
 
-def test_build_inbound_auth_uses_subnet_owner_hotkey(monkeypatch) -> None:
+
+@pytest.fixture
+def subtensor_settings(monkeypatch: pytest.MonkeyPatch) -> Settings:
+    monkeypatch.setenv("SUBTENSOR_ENDPOINT", "ws://127.0.0.1:9945")
+    monkeypatch.setenv("SUBTENSOR_NETUID", "2")
+    return Settings()
+
+
+def test_build_inbound_auth_uses_subnet_owner_hotkey(monkeypatch, subtensor_settings) -> None:
     expected_owner_coldkey_ss58 = "5DdemoOwnerColdkey"
     captured: dict[str, object] = {}
 
@@ -29,20 +37,17 @@ def test_build_inbound_auth_uses_subnet_owner_hotkey(monkeypatch) -> None:
         def close(self) -> None:
             captured["closed"] = True
 
-    monkeypatch.setenv("SUBTENSOR_ENDPOINT", "ws://127.0.0.1:9945")
-    monkeypatch.setenv("SUBTENSOR_NETUID", "2")
     monkeypatch.setattr(bootstrap.bt, "Subtensor", FakeSubtensor)
 
-    settings = Settings()
-    verifier = bootstrap._build_inbound_auth(settings)
+    verifier = bootstrap._build_inbound_auth(subtensor_settings)
 
     assert verifier.owner_coldkey_ss58 == expected_owner_coldkey_ss58
-    assert captured["network"] == settings.subtensor.endpoint
-    assert captured["netuid"] == settings.subtensor.netuid
+    assert captured["network"] == subtensor_settings.subtensor.endpoint
+    assert captured["netuid"] == subtensor_settings.subtensor.netuid
     assert captured["closed"] is True
 
 
-def test_build_inbound_auth_raises_when_owner_hotkey_missing(monkeypatch) -> None:
+def test_build_inbound_auth_raises_when_owner_hotkey_missing(monkeypatch, subtensor_settings) -> None:
     class FakeSubtensor:
         def __init__(self, *, network: str) -> None:
             self.network = network
@@ -53,17 +58,13 @@ def test_build_inbound_auth_raises_when_owner_hotkey_missing(monkeypatch) -> Non
         def close(self) -> None:
             return None
 
-    monkeypatch.setenv("SUBTENSOR_ENDPOINT", "ws://127.0.0.1:9945")
-    monkeypatch.setenv("SUBTENSOR_NETUID", "2")
     monkeypatch.setattr(bootstrap.bt, "Subtensor", FakeSubtensor)
 
-    settings = Settings()
     with pytest.raises(RuntimeError, match="subnet info"):
-        bootstrap._build_inbound_auth(settings)
+        bootstrap._build_inbound_auth(subtensor_settings)
 
 
-def test_inbound_verifier_rejects_non_owner_hotkey(monkeypatch) -> None:
-    keypair = bt.Keypair.create_from_mnemonic(bt.Keypair.generate_mnemonic())
+def test_inbound_verifier_rejects_non_owner_hotkey(monkeypatch, keypair) -> None:
     canonical = build_canonical_request("GET", "/v1/test", b"")
     signature = keypair.sign(canonical)
     header = f'Bittensor ss58="{keypair.ss58_address}",sig="{signature.hex()}"'
@@ -89,8 +90,7 @@ def test_inbound_verifier_rejects_non_owner_hotkey(monkeypatch) -> None:
         verifier.verify(method="GET", path_qs="/v1/test", body=b"", authorization_header=header)
 
 
-def test_inbound_verifier_caches_hotkey_owner_lookup(monkeypatch) -> None:
-    keypair = bt.Keypair.create_from_mnemonic(bt.Keypair.generate_mnemonic())
+def test_inbound_verifier_caches_hotkey_owner_lookup(monkeypatch, keypair) -> None:
     canonical = build_canonical_request("GET", "/v1/test", b"")
     signature = keypair.sign(canonical)
     header = f'Bittensor ss58="{keypair.ss58_address}",sig="{signature.hex()}"'
@@ -120,3 +120,36 @@ def test_inbound_verifier_caches_hotkey_owner_lookup(monkeypatch) -> None:
     verifier.verify(method="GET", path_qs="/v1/test", body=b"", authorization_header=header)
 
     assert calls["count"] == 1
+
+
+@pytest.mark.parametrize("body_size", _BODY_SIZES)
+def test_inbound_verifier_accepts_owner_signed_bodies(monkeypatch, keypair, body_size) -> None:
+    body = b"x" * body_size
+    signature = keypair.sign(build_canonical_request("POST", "/v1/test", body))
+    header = f'Bittensor ss58="{keypair.ss58_address}",sig="{signature.hex()}"'
+
+    class FakeSubtensor:
+        def __init__(self, *, network: str) -> None:
+            self.network = network
+
+        def get_hotkey_owner(self, hotkey_ss58: str):
+            return "5OwnerColdkey"
+
+        def close(self) -> None:
+            return None
+
+    monkeypatch.setattr(sr25519.bt, "Subtensor", FakeSubtensor)
+
+    verifier = BittensorSr25519InboundVerifier(
+        netuid=2,
+        network="ws://127.0.0.1:9945",
+        owner_coldkey_ss58="5OwnerColdkey",
+    )
+    ss58 = verifier.verify(
+        method="POST",
+        path_qs="/v1/test",
+        body=body,
+        authorization_header=header,
+    )
+
+    assert ss58 == keypair.ss58_address
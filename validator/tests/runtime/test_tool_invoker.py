@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-from collections.abc import Mapping, Sequence
-from typing import Any
+from collections.abc import Callable, Mapping, Sequence
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
 
 import pytest
-from pydantic import ValidationError
+from pydantic import BaseModel, ValidationError
 
 from caster_commons.llm.schema import (
     LlmChoice,
@@ -20,40 +21,92 @@ from caster_commons.tools.desearch import (
     DeSearchAiResultType,
     DeSearchAiTool,
 )
-from caster_commons.tools.search_models import (
-    SearchWebSearchRequest,
-    SearchWebSearchResponse,
-    SearchXResult,
-    SearchXSearchRequest,
-    SearchXSearchResponse,
-)
+from caster_commons.tools.search_models import SearchWebSearchResponse, SearchXSearchResponse
 from caster_validator.runtime.bootstrap import ALLOWED_TOOL_MODELS, RuntimeToolInvoker
 from validator.tests.fixtures.fakes import FakeReceiptLog
 
-pytestmark = pytest.mark.anyio("asyncio")
+if TYPE_CHECKING:
+    from caster_commons.tools.search_models import SearchWebSearchRequest, SearchXResult, SearchXSearchRequest
+
+pytestmark = pytest.mark.anyio
+
+_SHA_A = "a" * 40
+_SHA_B = "b" * 40
+# Both excerpts exceed MAX_REPO_EXCERPT_CHARS so the invoker's cap is exercised.
+_EXCERPT_Z = "z" * 1_200
+_EXCERPT_E = "e" * 1_500
+
+# Shared call payloads; the invoker copies kwargs before validating, so tests can pass these by reference.
+_SEARCH_WEB_KWARGS: dict[str, object] = {"query": "caster subnet"}
+_SEARCH_X_KWARGS: dict[str, object] = {"query": "#caster"}
+_LLM_CHAT_KWARGS: dict[str, object] = {
+    "messages": ({"role": "user", "content": "hi"},),
+    "model": ALLOWED_TOOL_MODELS[0],
+    "temperature": 0.1,
+}
+
+# Read-only at the top level; inner items stay plain dicts because the DeSearch docs adapter only accepts dicts there.
+_DEFAULT_AI_SEARCH_RESPONSE: Mapping[str, Any] = MappingProxyType(
+    {
+        "youtube_search": (
+            {
+                "title": "Example",
+                "link": "https://example.com",
+                "snippet": "Summary",
+            },
+        ),
+        "completion": "hello",
+    }
+)
+_DOCS_AI_SEARCH_RESPONSE: Mapping[str, Any] = MappingProxyType(
+    {
+        "search": (
+            {
+                "title": "Example",
+                "link": "https://example.com",
+                "snippet": "Snippet",
+            },
+        ),
+        "tweets": (
+            {
+                "id": "123",
+                "url": "https://x.com/foo/status/123",
+                "text": "hi",
+                "user": {"username": "foo"},
+            },
+        ),
+        "completion": "hello",
+    }
+)
+
+# The response tree is frozen dataclasses, so every stub call can hand back the same instance.
+_STUB_LLM_RESPONSE = LlmResponse(
+    id="resp-test",
+    choices=(
+        LlmChoice(
+            index=0,
+            message=LlmChoiceMessage(
+                role="assistant",
+                content=(LlmMessageContentPart(type="text", text="ok"),),
+            ),
+        ),
+    ),
+    usage=LlmUsage(prompt_tokens=10, completion_tokens=5, total_tokens=15),
+)
+
+
+def _dump_nonnull(request: BaseModel) -> dict[str, Any]:
+    # Search request fields are all scalars, so reading attributes matches model_dump(exclude_none=True).
+    return {name: value for name in type(request).model_fields if (value := getattr(request, name)) is not None}
 
 
 class StubDeSearchClient:
     def __init__(self) -> None:
-        self.calls: list[tuple[str, dict[str, Any]]] = []
-        self.ai_search_response: Mapping[str, Any] = {
-            "youtube_search": [
-                {
-                    "title": "Example",
-                    "link": "https://example.com",
-                    "snippet": "Summary",
-                }
-            ],
-            "completion": "hello",
-        }
-
-    async def post(self, endpoint: str, payload: Mapping[str, Any]) -> Mapping[str, Any]:
-        data = dict(payload)
-        self.calls.append((endpoint, data))
-        return {"endpoint": endpoint, "payload": data}
+        self.calls: list[tuple[str, Mapping[str, Any]]] = []
+        self.ai_search_response: Mapping[str, Any] = _DEFAULT_AI_SEARCH_RESPONSE
 
     async def search_links_web(self, request: SearchWebSearchRequest) -> SearchWebSearchResponse:
-        data = request.model_dump(exclude_none=True)
+        data = _dump_nonnull(request)
         self.calls.append(("web", data))
         return SearchWebSearchResponse(data=[])
 
@@ -61,7 +114,7 @@ class StubDeSearchClient:
         self,
         request: SearchXSearchRequest,
     ) -> SearchXSearchResponse:
-        data = request.model_dump(exclude_none=True)
+        data = _dump_nonnull(request)
         self.calls.append(("twitter", data))
         return SearchXSearchResponse(data=[])
 
@@ -107,7 +160,7 @@ class StubRepoSearchProvider:
                     "path": "docs/z.md",
                     "bm25": 2.0,
                     "url": "https://github.com/org/repo/blob/sha/docs/z.md",
-                    "excerpt": "z" * 1_200,
+                    "excerpt": _EXCERPT_Z,
                     "title": "docs/z.md",
                     "text": "this field must not be exposed by search_repo",
                 },
@@ -133,7 +186,7 @@ class StubRepoSearchProvider:
                     "path": "docs/a.md",
                     "url": "https://github.com/org/repo/blob/sha/docs/a.md",
                     "text": "full file text",
-                    "excerpt": "e" * 1_500,
+                    "excerpt": _EXCERPT_E,
                     "title": "docs/a.md",
                 }
             ]
@@ -183,34 +236,34 @@ class StubRepoSearchProvider:
 class StubChutesProvider:
     def __init__(self) -> None:
         self.calls: list[LlmRequest] = []
-        self.response_payload: Mapping[str, Any] = {
-            "choices": [
-                {
-                    "message": {"role": "assistant", "content": "ok"},
-                    "finish_reason": "stop",
-                    "index": 0,
-                }
-            ],
-            "id": "test",
-            "model": "demo-model",
-        }
 
     async def invoke(self, request: LlmRequest) -> LlmResponse:
         self.calls.append(request)
-        return LlmResponse(
-            id="resp-test",
-            choices=(
-                LlmChoice(
-                    index=0,
-                    message=LlmChoiceMessage(
-                        role="assistant",
-                        content=(LlmMessageContentPart(type="text", text="ok"),),
-                    ),
-                ),
-            ),
-            usage=LlmUsage(prompt_tokens=10, completion_tokens=5, total_tokens=15),
+        return _STUB_LLM_RESPONSE
+
+
+@pytest.fixture(scope="module")
+def _invoker_factory() -> Callable[..., RuntimeToolInvoker]:
+    receipt_log = FakeReceiptLog()
+
+    def make(
+        *,
+        search_client: StubDeSearchClient | None = None,
+        llm_provider: StubChutesProvider | None = None,
+        llm_provider_name: str | None = None,
+        repo_search_provider: StubRepoSearchProvider | None = None,
+    ) -> RuntimeToolInvoker:
+        return RuntimeToolInvoker(
+            receipt_log,
+            search_client=search_client,
+            llm_provider=llm_provider,
+            llm_provider_name=llm_provider_name,
+            repo_search_provider=repo_search_provider,
+            allowed_models=ALLOWED_TOOL_MODELS,
         )
 
+    return make
+
 
 async def _invoke(
     invoker: RuntimeToolInvoker,
@@ -218,80 +271,53 @@ async def _invoke(
     args: Sequence[object] | None = None,
     kwargs: Mapping[str, object] | None = None,
 ) -> Mapping[str, Any]:
+    # Call sites already pass tuples/dicts; the invoker copies kwargs itself before validating.
     return await invoker.invoke(
         tool,
-        args=tuple(args or ()),
-        kwargs=dict(kwargs or {}),
+        args=args if isinstance(args, tuple) else tuple(args or ()),
+        kwargs=kwargs if isinstance(kwargs, dict) else dict(kwargs or {}),
     )
 
 
-async def test_runtime_invoker_routes_search_payload() -> None:
-    stub_desearch = StubDeSearchClient()
-    invoker = RuntimeToolInvoker(
-        FakeReceiptLog(),
-        search_client=stub_desearch,
-        allowed_models=ALLOWED_TOOL_MODELS,
-    )
-
-    result = await _invoke(invoker, "search_web", kwargs={"query": "caster subnet"})
-
-    assert result == {"data": []}
-    assert stub_desearch.calls == [("web", {"query": "caster subnet"})]
-
-
-async def test_runtime_invoker_rejects_prompt_for_search_web() -> None:
-    stub_desearch = StubDeSearchClient()
-    invoker = RuntimeToolInvoker(
-        FakeReceiptLog(),
-        search_client=stub_desearch,
-        allowed_models=ALLOWED_TOOL_MODELS,
-    )
-
-    with pytest.raises(ValidationError) as excinfo:
-        await _invoke(invoker, "search_web", kwargs={"prompt": "caster subnet"})
-    assert any(
-        err.get("type") == "extra_forbidden" and err.get("loc") == ("prompt",)
-        for err in excinfo.value.errors()
-    )
-
-
-async def test_runtime_invoker_routes_search_x() -> None:
+@pytest.mark.parametrize(
+    ("tool", "channel", "kwargs"),
+    (
+        ("search_web", "web", _SEARCH_WEB_KWARGS),
+        ("search_x", "twitter", _SEARCH_X_KWARGS),
+    ),
+)
+async def test_runtime_invoker_routes_search(_invoker_factory, tool, channel, kwargs) -> None:
     stub_desearch = StubDeSearchClient()
-    invoker = RuntimeToolInvoker(
-        FakeReceiptLog(),
-        search_client=stub_desearch,
-        allowed_models=ALLOWED_TOOL_MODELS,
-    )
+    invoker = _invoker_factory(search_client=stub_desearch)
 
-    result = await _invoke(invoker, "search_x", kwargs={"query": "#caster"})
+    result = await _invoke(invoker, tool, kwargs=kwargs)
 
     assert result == {"data": []}
-    assert stub_desearch.calls[-1] == ("twitter", {"query": "#caster"})
+    assert stub_desearch.calls == [(channel, kwargs)]
 
 
-async def test_runtime_invoker_rejects_prompt_for_search_x() -> None:
+@pytest.mark.parametrize(
+    ("tool", "prompt"),
+    (
+        ("search_web", "caster subnet"),
+        ("search_x", "#caster"),
+    ),
+)
+async def test_runtime_invoker_rejects_prompt_for_search(_invoker_factory, tool, prompt) -> None:
     stub_desearch = StubDeSearchClient()
-    invoker = RuntimeToolInvoker(
-        FakeReceiptLog(),
-        search_client=stub_desearch,
-        allowed_models=ALLOWED_TOOL_MODELS,
-    )
+    invoker = _invoker_factory(search_client=stub_desearch)
 
     with pytest.raises(ValidationError) as excinfo:
-        await _invoke(invoker, "search_x", kwargs={"prompt": "#caster"})
+        await _invoke(invoker, tool, kwargs={"prompt": prompt})
     assert any(
         err.get("type") == "extra_forbidden" and err.get("loc") == ("prompt",)
         for err in excinfo.value.errors()
     )
 
 
-async def test_runtime_invoker_routes_search_ai() -> None:
+async def test_runtime_invoker_routes_search_ai(_invoker_factory) -> None:
     stub_desearch = StubDeSearchClient()
-    invoker = RuntimeToolInvoker(
-        FakeReceiptLog(),
-        search_client=stub_desearch,
-        allowed_models=ALLOWED_TOOL_MODELS,
-    )
+    invoker = _invoker_factory(search_client=stub_desearch)
 
     result = await _invoke(
         invoker,
@@ -311,31 +337,10 @@ async def test_runtime_invoker_routes_search_ai() -> None:
     assert stub_desearch.calls[-1][1]["result_type"] == "LINKS_WITH_FINAL_SUMMARY"
 
 
-async def test_runtime_invoker_routes_search_ai_docs_response() -> None:
+async def test_runtime_invoker_routes_search_ai_docs_response(_invoker_factory) -> None:
     stub_desearch = StubDeSearchClient()
-    stub_desearch.ai_search_response = {
-        "search": [
-            {
-                "title": "Example",
-                "link": "https://example.com",
-                "snippet": "Snippet",
-            }
-        ],
-        "tweets": [
-            {
-                "id": "123",
-                "url": "https://x.com/foo/status/123",
-                "text": "hi",
-                "user": {"username": "foo"},
-            }
-        ],
-        "completion": "hello",
-    }
-    invoker = RuntimeToolInvoker(
-        FakeReceiptLog(),
-        search_client=stub_desearch,
-        allowed_models=ALLOWED_TOOL_MODELS,
-    )
+    stub_desearch.ai_search_response = _DOCS_AI_SEARCH_RESPONSE
+    invoker = _invoker_factory(search_client=stub_desearch)
 
     result = await _invoke(
         invoker,
@@ -353,20 +358,16 @@ async def test_runtime_invoker_routes_search_ai_docs_response() -> None:
     assert result["data"][1]["source"] == "twitter"
 
 
-async def test_runtime_invoker_routes_search_repo_with_deterministic_ordering_and_excerpt_cap() -> None:
+async def test_runtime_invoker_routes_search_repo_with_deterministic_ordering_and_excerpt_cap(_invoker_factory) -> None:
     repo_provider = StubRepoSearchProvider()
-    invoker = RuntimeToolInvoker(
-        FakeReceiptLog(),
-        repo_search_provider=repo_provider,
-        allowed_models=ALLOWED_TOOL_MODELS,
-    )
+    invoker = _invoker_factory(repo_search_provider=repo_provider)
 
     result = await _invoke(
         invoker,
         "search_repo",
         kwargs={
             "repo_url": "https://github.com/org/repo",
-            "commit_sha": "a" * 40,
+            "commit_sha": _SHA_A,
             "query": "alpha beta",
             "path_glob": "docs/*.md",
             "limit": 10,
@@ -376,7 +377,7 @@ async def test_runtime_invoker_routes_search_repo_with_deterministic_ordering_an
     assert repo_provider.search_calls == [
         {
             "repo_url": "https://github.com/org/repo",
-            "commit_sha": "a" * 40,
+            "commit_sha": _SHA_A,
             "query": "alpha beta",
             "path_glob": "docs/*.md",
             "limit": 10,
@@ -389,20 +390,16 @@ async def test_runtime_invoker_routes_search_repo_with_deterministic_ordering_an
     assert "text" not in result["data"][2]
 
 
-async def test_runtime_invoker_routes_get_repo_file_with_text_and_excerpt_cap() -> None:
+async def test_runtime_invoker_routes_get_repo_file_with_text_and_excerpt_cap(_invoker_factory) -> None:
     repo_provider = StubRepoSearchProvider()
-    invoker = RuntimeToolInvoker(
-        FakeReceiptLog(),
-        repo_search_provider=repo_provider,
-        allowed_models=ALLOWED_TOOL_MODELS,
-    )
+    invoker = _invoker_factory(repo_search_provider=repo_provider)
 
     result = await _invoke(
         invoker,
         "get_repo_file",
         kwargs={
             "repo_url": "https://github.com/org/repo",
-            "commit_sha": "b" * 40,
+            "commit_sha": _SHA_B,
             "path": "docs/a.md",
             "start_line": 10,
             "end_line": 20,
@@ -412,7 +409,7 @@ async def test_runtime_invoker_routes_get_repo_file_with_text_and_excerpt_cap()
     assert repo_provider.get_file_calls == [
         {
             "repo_url": "https://github.com/org/repo",
-            "commit_sha": "b" * 40,
+            "commit_sha": _SHA_B,
             "path": "docs/a.md",
             "start_line": 10,
             "end_line": 20,
@@ -422,24 +419,11 @@ async def test_runtime_invoker_routes_get_repo_file_with_text_and_excerpt_cap()
     assert len(result["data"][0]["excerpt"]) == 1_000
 
 
-async def test_runtime_invoker_routes_llm_chat() -> None:
+async def test_runtime_invoker_routes_llm_chat(_invoker_factory) -> None:
     stub_chutes = StubChutesProvider()
-    invoker = RuntimeToolInvoker(
-        FakeReceiptLog(),
-        llm_provider=stub_chutes,
-        llm_provider_name="chutes",
-        allowed_models=ALLOWED_TOOL_MODELS,
-    )
+    invoker = _invoker_factory(llm_provider=stub_chutes, llm_provider_name="chutes")
 
-    result = await _invoke(
-        invoker,
-        "llm_chat",
-        kwargs={
-            "messages": [{"role": "user", "content": "hi"}],
-            "model": ALLOWED_TOOL_MODELS[0],
-            "temperature": 0.1,
-        },
-    )
+    result = await _invoke(invoker, "llm_chat", kwargs=_LLM_CHAT_KWARGS)
 
     assert result["choices"][0]["message"]["content"][0]["text"] == "ok"
     assert result["usage"]["total_tokens"] == 15
@@ -451,8 +435,8 @@ async def test_runtime_invoker_routes_llm_chat() -> None:
     assert recorded.provider == "chutes"
 
 
-async def test_runtime_invoker_rejects_missing_clients() -> None:
-    invoker = RuntimeToolInvoker(FakeReceiptLog(), allowed_models=ALLOWED_TOOL_MODELS)
+async def test_runtime_invoker_rejects_missing_clients(_invoker_factory) -> None:
+    invoker = _invoker_factory()
 
     with pytest.raises(LookupError):
         await _invoke(invoker, "search_web", kwargs={})
@@ -463,7 +447,7 @@ async def test_runtime_invoker_rejects_missing_clients() -> None:
             "search_repo",
             kwargs={
                 "repo_url": "https://github.com/org/repo",
-                "commit_sha": "a" * 40,
+                "commit_sha": _SHA_A,
                 "query": "caster",
             },
         )
@@ -476,14 +460,9 @@ async def test_runtime_invoker_rejects_missing_clients() -> None:
         )
 
 
-async def test_runtime_invoker_blocks_disallowed_models() -> None:
+async def test_runtime_invoker_blocks_disallowed_models(_invoker_factory) -> None:
     stub_chutes = StubChutesProvider()
-    invoker = RuntimeToolInvoker(
-        FakeReceiptLog(),
-        llm_provider=stub_chutes,
-        llm_provider_name="chutes",
-        allowed_models=ALLOWED_TOOL_MODELS,
-    )
+    invoker = _invoker_factory(llm_provider=stub_chutes, llm_provider_name="chutes")
 
     with pytest.raises(ValueError, match="not allowed"):
         await _invoke(